@@ -49,12 +49,14 @@ def _extract_vectors(resp):
     except Exception:
         return {}
 
-async def barrier(vstore, ids: Iterable[str], *, gone=False, pause=0.05):
+async def barrier(vstore, ids: Iterable[str], *, gone=False, pause=0.05,
+                  sleep=asyncio.sleep):
     """
     Wait until every id is present (gone=False) or absent (gone=True).
 
     vstore : PineconeVectorStore
     ids    : iterable of vector IDs
+    sleep  : coroutine function awaited with `pause` between polls
     """
     index = getattr(vstore, "_index", None) \
             or getattr(vstore, "_pinecone_index", None)
@@ -66,7 +68,7 @@ async def barrier(vstore, ids: Iterable[str], *, gone=False, pause=0.05):
         vectors = _extract_vectors(index.fetch(ids=ids))
         if (gone and not vectors) or (not gone and len(vectors) == len(ids)):
             return
-        await asyncio.sleep(pause)
+        await sleep(pause)
 
 
 
@@ -122,7 +122,7 @@ Answer:"""
         """
         # Generate correlation ID and start timing
         correlation_id = str(uuid.uuid4())[:8]
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             self.performance_stats['total_requests'] += 1
@@ -143,6 +143,11 @@ Answer:"""
             if user_id:
                 rate_result = await self.rate_limiter.check_user_limit(user_id, "rag_requests")
                 
+                if rate_result.is_error:
+                    logger.error("Rate limit check failed for user %s [%s]: %s",
+                                 user_id, correlation_id, rate_result.error)
+                    return self._generate_error_response(query, rate_result.error)
+                
                 if not rate_result.allowed:
                     logger.warning("Rate limit exceeded for user %s [%s]: %s", 
                                  user_id, correlation_id, rate_result.message)
@@ -168,7 +173,7 @@ Answer:"""
             
             if cached_response:
                 self.performance_stats['cache_hits'] += 1
-                response_time = time.time() - start_time
+                response_time = time.perf_counter() - start_time
                 self._update_performance_stats(response_time)
                 
                 logger.info("Cache hit for RAG query [%s]: %.2fs", 
@@ -204,7 +209,7 @@ Answer:"""
             )
             
             # Update performance metrics
-            response_time = time.time() - start_time
+            response_time = time.perf_counter() - start_time
             self._update_performance_stats(response_time)
             
             # Increment user rate limit counter on successful completion
@@ -229,7 +234,7 @@ Answer:"""
             return response
             
         except Exception as e:
-            response_time = time.time() - start_time
+            response_time = time.perf_counter() - start_time
             logger.error("Unexpected error in optimized RAG handler [%s]: %s (%.2fs)", 
                         correlation_id, str(e), response_time)
             return self._generate_error_response(query, str(e))
@@ -29,6 +29,12 @@ class RateLimitResult:
     message: str
     reset_time: datetime
     limit_type: str
+    error: Optional[str] = None  # Set when the check could not be evaluated (bad input)
+
+    @property
+    def is_error(self) -> bool:
+        """True if the check was rejected because of invalid input."""
+        return self.error is not None
 
 @dataclass
 class RateLimitConfig:
@@ -84,6 +90,14 @@ class DailyRateLimiter:
                 limit_type=limit_type
             )
         
+        # Reject invalid input up front instead of round-tripping to Supabase
+        if not user_id:
+            return self._invalid_input_result("Missing user ID for rate limiting", limit_type)
+        
+        daily_limit = self._user_daily_limit(limit_type)
+        if daily_limit is None:
+            return self._invalid_input_result(f"Unknown rate limit type: {limit_type}", limit_type)
+        
         try:
             # Call Supabase function to check user limit
             result = self.supabase.rpc(
@@ -92,19 +106,16 @@ class DailyRateLimiter:
             ).execute()
             
             if not result.data:
-                raise Exception("No data returned from check_user_limit")
+                logger.error("No data returned from check_user_limit for %s", user_id)
+                return self._fail_open_result(
+                    daily_limit,
+                    "Rate limit check failed - allowing request",
+                    limit_type
+                )
             
             data = result.data[0]
             current_count = data.get('current_count', 0) or 0  # Handle None values
             
-            # Get the appropriate limit based on limit type
-            if limit_type == "rag_requests":
-                daily_limit = self.config.user_rag_requests
-            elif limit_type == "file_uploads":
-                daily_limit = self.config.user_file_uploads
-            else:
-                daily_limit = 10  # Default fallback
-                
             # Check if limit is exceeded
             can_proceed = current_count < daily_limit
             # Wisdom warning should trigger on the 7th request (when about to reach 70%)
@@ -133,17 +144,12 @@ class DailyRateLimiter:
             )
             
         except Exception as e:
-            logger.error(f"Error checking user limit for {user_id}: {e}")
+            logger.error("Error checking user limit for %s: %s", user_id, e)
             # Fail open - allow request but log error
-            return RateLimitResult(
-                allowed=True,
-                current_count=0,
-                daily_limit=self.config.user_rag_requests,
-                warning_threshold=False,
-                wisdom_warning=False,
-                message="Rate limit check failed - allowing request",
-                reset_time=self.get_next_reset_time(),
-                limit_type=limit_type
+            return self._fail_open_result(
+                daily_limit,
+                "Rate limit check failed - allowing request",
+                limit_type
             )
     
     async def check_global_limit(self, limit_type: str) -> RateLimitResult:
@@ -176,7 +182,12 @@ class DailyRateLimiter:
             ).execute()
 
             if not result.data:
-                raise Exception("No data returned from check_global_limit")
+                logger.error("No data returned from check_global_limit for %s", limit_type)
+                return self._fail_open_result(
+                    self.config.global_file_uploads,
+                    "Global limit check failed - allowing request",
+                    limit_type
+                )
 
             data = result.data[0]
             current_count = data.get('current_count', 0) or 0  # Handle None values
@@ -211,17 +222,12 @@ class DailyRateLimiter:
             )
             
         except Exception as e:
-            logger.error(f"Error checking global limit for {limit_type}: {e}")
+            logger.error("Error checking global limit for %s: %s", limit_type, e)
             # Fail open - allow request but log error
-            return RateLimitResult(
-                allowed=True,
-                current_count=0,
-                daily_limit=self.config.global_file_uploads,
-                warning_threshold=False,
-                wisdom_warning=False,
-                message="Global limit check failed - allowing request",
-                reset_time=self.get_next_reset_time(),
-                limit_type=limit_type
+            return self._fail_open_result(
+                self.config.global_file_uploads,
+                "Global limit check failed - allowing request",
+                limit_type
             )
     
     async def increment_user_count(self, user_id: str, limit_type: str) -> int:
@@ -245,11 +251,11 @@ class DailyRateLimiter:
             ).execute()
             
             new_count = result.data if result.data else 0
-            logger.debug(f"Incremented {limit_type} for user {user_id}: {new_count}")
+            logger.debug("Incremented %s for user %s: %s", limit_type, user_id, new_count)
             return new_count
             
         except Exception as e:
-            logger.error(f"Error incrementing user count for {user_id}: {e}")
+            logger.error("Error incrementing user count for %s: %s", user_id, e)
             return 0
     
     async def increment_global_count(self, limit_type: str) -> int:
@@ -272,11 +278,11 @@ class DailyRateLimiter:
             ).execute()
             
             new_count = result.data if result.data else 0
-            logger.debug(f"Incremented global {limit_type}: {new_count}")
+            logger.debug("Incremented global %s: %s", limit_type, new_count)
             return new_count
             
         except Exception as e:
-            logger.error(f"Error incrementing global count for {limit_type}: {e}")
+            logger.error("Error incrementing global count for %s: %s", limit_type, e)
             return 0
     
     async def track_openai_usage(self, user_id: str, tokens: int, cost: float, model: str = "gpt-4") -> None:
@@ -300,10 +306,10 @@ class DailyRateLimiter:
                 }
             ).execute()
             
-            logger.debug(f"Tracked OpenAI usage for user {user_id}: {tokens} tokens, ${cost:.4f}")
+            logger.debug("Tracked OpenAI usage for user %s: %d tokens, $%.4f", user_id, tokens, cost)
             
         except Exception as e:
-            logger.error(f"Error tracking OpenAI usage for {user_id}: {e}")
+            logger.error("Error tracking OpenAI usage for %s: %s", user_id, e)
     
     async def get_user_stats(self, user_id: str) -> Dict[str, Any]:
         """
@@ -324,7 +330,7 @@ class DailyRateLimiter:
                 'user_id', user_id_str
             ).execute()
             
-            logger.debug(f"User limits query result for {user_id}: {len(user_result.data)} records")
+            logger.debug("User limits query result for %s: %d records", user_id, len(user_result.data))
             
             # Get OpenAI usage for today (and yesterday to handle timezone issues)
             now_toronto = datetime.now(self.timezone)
@@ -336,7 +342,7 @@ class DailyRateLimiter:
                 'user_id', user_id_str
             ).in_('date_toronto', [today_str, yesterday_str]).execute()
             
-            logger.debug(f"OpenAI usage query result for {user_id}: {len(openai_result.data)} records")
+            logger.debug("OpenAI usage query result for %s: %d records", user_id, len(openai_result.data))
             
             # Structure the response
             stats = {
@@ -354,16 +360,16 @@ class DailyRateLimiter:
                     'last_reset': row['date_toronto']
                 }
             
-            logger.debug(f"User stats compiled successfully for {user_id}")
+            logger.debug("User stats compiled successfully for %s", user_id)
             return stats
             
         except ValueError as e:
-            logger.error(f"Invalid user_id format {user_id}: {e}")
+            logger.error("Invalid user_id format %s: %s", user_id, e)
             return {'user_id': user_id, 'error': f'Invalid user ID format: {e}'}
         except Exception as e:
-            logger.error(f"Error getting user stats for {user_id}: {e}")
+            logger.error("Error getting user stats for %s: %s", user_id, e)
             import traceback
-            logger.error(f"Full traceback: {traceback.format_exc()}")
+            logger.error("Full traceback: %s", traceback.format_exc())
             return {'user_id': user_id, 'error': str(e)}
     
     def get_next_reset_time(self) -> datetime:
@@ -380,6 +386,42 @@ class DailyRateLimiter:
         )
         return midnight_toronto
     
+    def _user_daily_limit(self, limit_type: str) -> Optional[int]:
+        """Return the configured daily limit for a user limit type, or None if unknown."""
+        if limit_type == "rag_requests":
+            return self.config.user_rag_requests
+        if limit_type == "file_uploads":
+            return self.config.user_file_uploads
+        return None
+    
+    def _fail_open_result(self, daily_limit: int, message: str, limit_type: str) -> RateLimitResult:
+        """Build the permissive result returned when the backing store cannot be queried."""
+        return RateLimitResult(
+            allowed=True,
+            current_count=0,
+            daily_limit=daily_limit,
+            warning_threshold=False,
+            wisdom_warning=False,
+            message=message,
+            reset_time=self.get_next_reset_time(),
+            limit_type=limit_type
+        )
+    
+    def _invalid_input_result(self, error: str, limit_type: str) -> RateLimitResult:
+        """Build the rejecting result returned for invalid check arguments."""
+        logger.warning("Rejected rate limit check: %s", error)
+        return RateLimitResult(
+            allowed=False,
+            current_count=0,
+            daily_limit=0,
+            warning_threshold=False,
+            wisdom_warning=False,
+            message=f"❌ {error}",
+            reset_time=self.get_next_reset_time(),
+            limit_type=limit_type,
+            error=error
+        )
+    
     def _format_limit_message(self, can_proceed: bool, current: int, limit: int, 
                             wisdom_warning: bool, reset_time: str, limit_type: str) -> str:
         """Format user-friendly rate limit message."""
@@ -48,14 +48,14 @@ class SimpleConnectionManager:
     
     async def track_request(self, operation_name: str, func, *args, **kwargs):
         """Track a request and collect statistics."""
-        start_time = time.time()
+        start_time = time.perf_counter()
         self.stats.total_requests += 1
         
         try:
             result = await func(*args, **kwargs)
             
             # Track successful request
-            elapsed = time.time() - start_time
+            elapsed = time.perf_counter() - start_time
             self.stats.successful_requests += 1
             self.stats.total_response_time += elapsed
             
@@ -69,7 +69,7 @@ class SimpleConnectionManager:
             
         except Exception as e:
             # Track failed request
-            elapsed = time.time() - start_time
+            elapsed = time.perf_counter() - start_time
             self.stats.failed_requests += 1
             self.stats.total_response_time += elapsed
             
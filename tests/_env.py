@@ -0,0 +1,5 @@
+# tests/_env.py
+"""Test environment values shared by conftest and individual test modules."""
+
+# Placeholder OpenAI key; integration tests skip when it is the only key set
+PLACEHOLDER_OPENAI_API_KEY = "test_openai_key_12345"
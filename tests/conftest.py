@@ -1,17 +1,22 @@
 # tests/conftest.py
 import sys, os
 import pytest
-from unittest.mock import patch, MagicMock
+from contextlib import ExitStack
+from types import SimpleNamespace
+from typing import Callable
+from unittest.mock import patch, MagicMock, AsyncMock, seal
 from pathlib import Path
 
 # Insert the project root (one level up) onto sys.path
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, ROOT)
 
+from tests._env import PLACEHOLDER_OPENAI_API_KEY
+
 # Set up test environment variables BEFORE any imports
 test_env = {
     "DISCORD_TOKEN": "test_discord_token_12345",
-    "OPENAI_API_KEY": "test_openai_key_12345", 
+    "OPENAI_API_KEY": PLACEHOLDER_OPENAI_API_KEY,
     "PINECONE_API_KEY": "test_pinecone_key_12345",
     "PINECONE_CALENDAR_INDEX": "test-calendar-index",
     "SUPABASE_URL": "https://test.supabase.co",
@@ -25,24 +30,22 @@ for key, value in test_env.items():
 
 # Early mocking to prevent real API client initialization
 # This needs to happen before any modules are imported that use these clients
-_supabase_patcher = patch('supabase.create_client')
-_pinecone_patcher = patch('pinecone.Pinecone')
-_openai_patcher = patch('openai.OpenAI')
-
-# Start patches immediately
-mock_supabase = _supabase_patcher.start()
-mock_pinecone = _pinecone_patcher.start()
-mock_openai = _openai_patcher.start()
-
-# Configure the mocks
 mock_supabase_instance = MagicMock()
-mock_supabase.return_value = mock_supabase_instance
-
 mock_pinecone_instance = MagicMock()
-mock_pinecone.return_value = mock_pinecone_instance
-
 mock_openai_instance = MagicMock()
-mock_openai.return_value = mock_openai_instance
+
+# Replace the client constructors with plain factories rather than MagicMock
+# callables, so building a client skips Mock's call bookkeeping entirely
+_early_patches = (
+    ('supabase.create_client', lambda *args, **kwargs: mock_supabase_instance),
+    ('pinecone.Pinecone', lambda *args, **kwargs: mock_pinecone_instance),
+    ('openai.OpenAI', lambda *args, **kwargs: mock_openai_instance),
+)
+
+# Start patches immediately; the stack unwinds them in reverse order
+_patch_stack = ExitStack()
+for _target, _factory in _early_patches:
+    _patch_stack.enter_context(patch(_target, new=_factory))
 
 @pytest.fixture(scope="session", autouse=True)
 def setup_test_environment():
@@ -51,9 +54,7 @@ def setup_test_environment():
     yield
     
     # Clean up patches when session ends
-    _supabase_patcher.stop()
-    _pinecone_patcher.stop() 
-    _openai_patcher.stop()
+    _patch_stack.close()
 
 @pytest.fixture
 def sample_tenant_config():
@@ -78,3 +79,48 @@ def sample_tenant_config():
             }
         }
     }
+
+class _FakeUser(SimpleNamespace):
+    """Discord user stand-in; ``str(user)`` renders like ``name#discriminator``."""
+
+    def __str__(self) -> str:
+        return self.name
+
+class _FakeResponse(SimpleNamespace):
+    """Interaction response stand-in; tests flip ``done`` to drive ``is_done()``."""
+
+    def is_done(self) -> bool:
+        return self.done
+
+@pytest.fixture(scope="session")
+def _interaction_factory() -> Callable[[], SimpleNamespace]:
+    """Return a callable that builds a fresh fake Discord interaction.
+
+    Plain attributes live on SimpleNamespaces; only the awaited response
+    methods are mocks, so tests can still assert on them.
+    """
+    def build() -> SimpleNamespace:
+        response = _FakeResponse(
+            done=False,
+            defer=AsyncMock(return_value=None),
+            send_message=AsyncMock(return_value=None),
+        )
+        followup = SimpleNamespace(send=AsyncMock(return_value=None))
+        # Sealed so a typo'd attribute raises instead of growing a child mock
+        for mock in (response.defer, response.send_message, followup.send):
+            seal(mock)
+        return SimpleNamespace(
+            guild_id=111,
+            channel_id=222,
+            user=_FakeUser(id=12345, name="testuser#1234"),
+            channel=SimpleNamespace(name="test-channel"),
+            response=response,
+            followup=followup,
+        )
+
+    return build
+
+@pytest.fixture
+def mock_interaction(_interaction_factory) -> SimpleNamespace:
+    """Create a fake Discord interaction for slash commands."""
+    return _interaction_factory()
@@ -0,0 +1,20 @@
+# tests/integration/conftest.py
+import pytest
+from pathlib import Path
+
+LLM_CACHE_PATH = Path(__file__).resolve().parents[2] / ".pytest_llm_cache.db"
+
+@pytest.fixture(scope="session", autouse=True)
+def llm_cache():
+    """Serve repeated LLM prompts from a local SQLite cache across runs.
+
+    Delete ``.pytest_llm_cache.db`` to force fresh API calls.
+    """
+    from langchain.globals import get_llm_cache, set_llm_cache
+    from langchain_community.cache import SQLiteCache
+
+    previous = get_llm_cache()
+    cache = SQLiteCache(database_path=str(LLM_CACHE_PATH))
+    set_llm_cache(cache)
+    yield cache
+    set_llm_cache(previous)
@@ -4,10 +4,13 @@ Test script to verify HTTP 410 error handling in calendar sync.
 """
 
 import asyncio
+import functools
 import json
 import sys
 import os
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Mapping
 
 # Add project root to path for imports
 project_root = Path(__file__).parent.parent.parent
@@ -17,13 +20,19 @@ from calendar_module.delta_sync import delta_sync_calendar
 from calendar_module.sync_store import get_calendar_sync_token, set_calendar_sync_token
 from utils.logging_config import logger
 
+TENANTS_PATH = project_root / 'tenants.json'
+
+@functools.cache
+def _load_tenants() -> Mapping[str, Any]:
+    """Parse tenants.json once and share the read-only result."""
+    with open(TENANTS_PATH, 'r') as f:
+        return MappingProxyType(json.load(f))
+
 async def test_sync_with_invalid_token():
     """Test sync behavior with an invalid/expired token."""
     
     # Load context from tenants.json (relative to project root)
-    tenants_path = project_root / 'tenants.json'
-    with open(tenants_path, 'r') as f:
-        tenants = json.load(f)
+    tenants = _load_tenants()
     
     # Get the first tenant context
     tenant_id = next(iter(tenants))
@@ -11,28 +11,52 @@ To run these tests:
 2. Run: pytest tests/integration/test_query_parser.py -v
 """
 import os
+import asyncio
 import pytest
+import pytest_asyncio
 from datetime import datetime
-from calendar_module.query_parser import parse_query, CalQuery
+from typing import TYPE_CHECKING
 
-pytestmark = pytest.mark.asyncio
+from tests._env import PLACEHOLDER_OPENAI_API_KEY
 
-def _skip_if_no_key():
-    if not os.getenv("OPENAI_API_KEY"):
-        pytest.skip("Skipping integration test: no OPENAI_API_KEY")
+if TYPE_CHECKING:
+    from calendar_module.query_parser import CalQuery
 
-async def _assert_common(p: CalQuery):
+# tests/conftest.py fills in a placeholder key, which cannot reach OpenAI either
+pytestmark = pytest.mark.skipif(
+    os.getenv("OPENAI_API_KEY", "") in ("", PLACEHOLDER_OPENAI_API_KEY),
+    reason="Skipping integration test: no OPENAI_API_KEY",
+)
+
+# Fixed reference date keeps the prompt identical between runs so cached
+# responses (local and OpenAI prompt caching) can be reused
+FIXED_TODAY = datetime(2025, 1, 15)
+
+QUERIES = {
+    "date_only": "What's on Friday?",
+    "next_three_deadlines": "Next 3 project deadlines?",
+    "bounded_window": "Show me events between May 1 and May 5",
+    "non_calendar": "How hard is this class?",
+}
+
+@pytest_asyncio.fixture(scope="module")
+async def parsed() -> dict[str, "CalQuery"]:
+    """Parse every query once, concurrently, so the suite waits on the slowest call only."""
+    # Imported here so a skipped run never loads LangChain or builds the parser
+    from calendar_module.query_parser import parse_query
+    results = await asyncio.gather(*(parse_query(q, FIXED_TODAY) for q in QUERIES.values()))
+    return dict(zip(QUERIES, results))
+
+async def _assert_common(p: "CalQuery"):
+    from calendar_module.query_parser import CalQuery
     assert isinstance(p, CalQuery)
     assert isinstance(p.applicable, bool)
     # limit, if set, must be >0
     if p.limit is not None:
         assert p.limit > 0
 
-@pytest.mark.asyncio
-async def test_date_only_query():
-    _skip_if_no_key()
-    today = datetime.today()
-    p = await parse_query("What's on Friday?", today)
+async def test_date_only_query(parsed):
+    p = parsed["date_only"]
     await _assert_common(p)
     assert p.applicable is True
     assert p.type == "both"
@@ -41,11 +65,8 @@ async def test_date_only_query():
     assert p.date_from is not None  # Dates are returned as ISO strings
     assert p.date_to is not None
 
-@pytest.mark.asyncio
-async def test_next_three_deadlines():
-    _skip_if_no_key()
-    today = datetime.today()
-    p = await parse_query("Next 3 project deadlines?", today)
+async def test_next_three_deadlines(parsed):
+    p = parsed["next_three_deadlines"]
     await _assert_common(p)
     assert p.applicable is True
     # allow either 'task' or 'both' if the parser hedges
@@ -55,11 +76,8 @@ async def test_next_three_deadlines():
     # The LLM may set date ranges for "next" queries
     assert p.date_from is not None or p.date_to is not None
 
-@pytest.mark.asyncio
-async def test_bounded_window_query():
-    _skip_if_no_key()
-    today = datetime.today()
-    p = await parse_query("Show me events between May 1 and May 5", today)
+async def test_bounded_window_query(parsed):
+    p = parsed["bounded_window"]
     await _assert_common(p)
     assert p.applicable is True
     assert p.type in ["event", "both"]  # Accept either response from OpenAI
@@ -68,11 +86,8 @@ async def test_bounded_window_query():
     assert p.date_to is not None
     # Both dates should be present for bounded queries
 
-@pytest.mark.asyncio
-async def test_non_calendar_query():
-    _skip_if_no_key()
-    today = datetime.today()
-    p = await parse_query("How hard is this class?", today)
+async def test_non_calendar_query(parsed):
+    p = parsed["non_calendar"]
     await _assert_common(p)
     assert p.applicable is False
     # All other fields should then be None
@@ -1,12 +1,10 @@
 # tests/test_delta_sync.py
 import pytest
-import asyncio
-import datetime as dt
-import pytz
-from unittest.mock import Mock, patch, AsyncMock, MagicMock, call
-from langchain_core.documents import Document
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import Mock, AsyncMock, call
 from googleapiclient.errors import HttpError
 
+from calendar_module import delta_sync as _ds
 from calendar_module.delta_sync import (
     delta_sync_calendar, 
     delta_sync_tasks,
@@ -16,20 +14,28 @@ from calendar_module.delta_sync import (
 )
 
 
-@pytest.fixture
+# Raised by the Calendar API when a stored sync token has expired
+_HTTP_410 = HttpError(
+    resp=SimpleNamespace(status=410, reason="Gone"),
+    content=b'{"error": {"message": "sync token no longer valid"}}',
+)
+
+
+# Fixture payloads are shared read-only across the session; delta_sync never mutates them
+@pytest.fixture(scope="session")
 def mock_context():
-    return {
+    return MappingProxyType({
         "calendar_id": "test_calendar@example.com",
         "tasklist_id": "test_tasklist_id",
         "timezone": "America/Toronto",
         "guild_id": "123456789",
         "name": "test-channel"
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_calendar_event():
-    return {
+    return MappingProxyType({
         "id": "event_123",
         "summary": "Test Meeting",
         "description": "Important meeting description",
@@ -37,88 +43,103 @@ def mock_calendar_event():
         "start": {"dateTime": "2025-05-30T10:00:00-04:00"},
         "end": {"dateTime": "2025-05-30T11:00:00-04:00"},
         "status": "confirmed"
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_task():
-    return {
+    return MappingProxyType({
         "id": "task_123",
         "title": "Complete project at 5pm",
         "notes": "Important task notes",
         "due": "2025-05-30T00:00:00.000Z",
         "status": "needsAction"
-    }
+    })
+
+
+def _resp_with_vectors(vectors):
+    resp = Mock()
+    resp.vectors = vectors
+    return resp
+
+
+def _resp_with_to_dict(**to_dict):
+    resp = _resp_with_vectors(None)
+    resp.to_dict.configure_mock(**to_dict)
+    return resp
+
+
+# Responses are only read by _extract_vectors, so they are built once at import.
+# When resp.vectors exists but is falsy, `resp.vectors or {}` returns {} before
+# the to_dict fallback is ever tried.
+_EXTRACT_VECTORS_CASES = [
+    pytest.param(
+        {"vectors": {"id1": {"values": [0.1, 0.2]}, "id2": {"values": [0.3, 0.4]}}},
+        {"id1": {"values": [0.1, 0.2]}, "id2": {"values": [0.3, 0.4]}},
+        id="dict_response",
+    ),
+    pytest.param(
+        _resp_with_vectors({"id1": {"values": [0.1, 0.2]}}),
+        {"id1": {"values": [0.1, 0.2]}},
+        id="object_with_vectors_attr",
+    ),
+    pytest.param(
+        _resp_with_to_dict(return_value={"vectors": {"id1": {"values": [0.1, 0.2]}}}),
+        {},
+        id="object_with_to_dict",
+    ),
+    pytest.param(
+        _resp_with_to_dict(side_effect=Exception("Failed")),
+        {},
+        id="fallback_empty",
+    ),
+]
 
 
 class TestExtractVectors:
-    def test_extract_vectors_dict_response(self):
-        """Test extracting vectors from dict response."""
-        resp = {"vectors": {"id1": {"values": [0.1, 0.2]}, "id2": {"values": [0.3, 0.4]}}}
-        result = _extract_vectors(resp)
-        assert result == {"id1": {"values": [0.1, 0.2]}, "id2": {"values": [0.3, 0.4]}}
-
-    def test_extract_vectors_object_with_vectors_attr(self):
-        """Test extracting vectors from object with vectors attribute."""
-        mock_resp = Mock()
-        mock_resp.vectors = {"id1": {"values": [0.1, 0.2]}}
-        result = _extract_vectors(mock_resp)
-        assert result == {"id1": {"values": [0.1, 0.2]}}
-
-    def test_extract_vectors_object_with_to_dict(self):
-        """Test extracting vectors from object with to_dict method."""
-        mock_resp = Mock()
-        mock_resp.vectors = None
-        mock_resp.to_dict.return_value = {"vectors": {"id1": {"values": [0.1, 0.2]}}}
-        
-        # When hasattr(resp, "vectors") is True but vectors is None/falsy,
-        # it should return {} based on the `return resp.vectors or {}` logic
-        result = _extract_vectors(mock_resp)
-        assert result == {}  # Because resp.vectors is None, so `None or {}` returns {}
-
-    def test_extract_vectors_fallback_empty(self):
-        """Test fallback to empty dict when extraction fails."""
-        mock_resp = Mock()
-        mock_resp.vectors = None
-        mock_resp.to_dict.side_effect = Exception("Failed")
-        result = _extract_vectors(mock_resp)
-        assert result == {}
+    @pytest.mark.parametrize("resp, expected", _EXTRACT_VECTORS_CASES)
+    def test_extract_vectors(self, resp, expected):
+        """Test extracting vectors from each Pinecone response shape."""
+        assert _extract_vectors(resp) == expected
 
 
 class TestBarrier:
+    @pytest.fixture
+    def no_sleep(self):
+        """Polling pause for barrier that returns immediately."""
+        return AsyncMock()
+
     @pytest.mark.asyncio
-    async def test_barrier_wait_for_presence(self):
+    async def test_barrier_wait_for_presence(self, no_sleep):
         """Test barrier waiting for vectors to be present."""
         mock_store = Mock()
         mock_index = Mock()
         mock_store._index = mock_index
         
         # First call returns empty, second call returns vectors
-        mock_index.fetch.side_effect = [
+        mock_index.fetch.side_effect = iter([
             {"vectors": {}},  # First call: vectors not present
             {"vectors": {"id1": {"values": [0.1]}, "id2": {"values": [0.2]}}}  # Second call: vectors present
-        ]
+        ])
         
-        with patch('asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
-            await barrier(mock_store, ["id1", "id2"], gone=False, pause=0.01)
-            mock_sleep.assert_called_once_with(0.01)
+        await barrier(mock_store, ["id1", "id2"], gone=False, pause=0.01, sleep=no_sleep)
+        no_sleep.assert_called_once_with(0.01)
 
     @pytest.mark.asyncio
-    async def test_barrier_wait_for_absence(self):
+    async def test_barrier_wait_for_absence(self, no_sleep):
         """Test barrier waiting for vectors to be absent."""
         mock_store = Mock()
         mock_index = Mock()
         mock_store._index = mock_index
         
         # First call returns vectors, second call returns empty
-        mock_index.fetch.side_effect = [
+        mock_index.fetch.side_effect = iter([
             {"vectors": {"id1": {"values": [0.1]}}},  # First call: vectors present
             {"vectors": {}}  # Second call: vectors absent
-        ]
+        ])
         
-        with patch('asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
-            await barrier(mock_store, ["id1", "id2"], gone=True, pause=0.01)
-            mock_sleep.assert_called_once_with(0.01)
+        await barrier(mock_store, ["id1", "id2"], gone=True, pause=0.01, sleep=no_sleep)
+        no_sleep.assert_called_once_with(0.01)
 
     @pytest.mark.asyncio
     async def test_barrier_invalid_store(self):
@@ -170,92 +191,116 @@ class TestSafeDelete:
         safe_delete(mock_store, ["id1"])
 
 
+async def _async_noop(*args, **kwargs):
+    return None
+
+
+@pytest.fixture
+def delta_sync_mocks(monkeypatch):
+    """Patch delta_sync's Google, Pinecone and sync-state collaborators.
+
+    Returns the mocks by name so tests can wire responses and assert calls.
+    get_creds and barrier are never asserted on, so they are plain no-op
+    coroutines rather than AsyncMocks.
+    """
+    mocks = SimpleNamespace(
+        get_calendar_sync_token=Mock(return_value="test_token"),
+        set_calendar_sync_token=Mock(),
+        get_tasks_last_updated=Mock(return_value="2025-05-29T00:00:00Z"),
+        set_tasks_last_updated=Mock(),
+        get_creds=_async_noop,
+        build=Mock(),
+        get_vector_store=Mock(),
+        safe_delete=Mock(),
+        barrier=_async_noop,
+    )
+    for name, mock in vars(mocks).items():
+        monkeypatch.setattr(_ds, name, mock)
+    return mocks
+
+
+def _listing(payload):
+    """Google API collection whose list(...).execute() returns ``payload``."""
+    return SimpleNamespace(list=lambda **kwargs: SimpleNamespace(execute=lambda: payload))
+
+
+def _calendar_service(items=(), next_token=None, events=None):
+    """Calendar service stub; pass a Mock as ``events`` when the test asserts on it."""
+    if events is None:
+        events = _listing({"items": list(items), "nextSyncToken": next_token})
+    return SimpleNamespace(events=lambda: events)
+
+
+def _tasks_service(items):
+    return SimpleNamespace(tasks=lambda: _listing({"items": list(items)}))
+
+
+def _failing_upsert(*args, **kwargs):
+    raise Exception("Pinecone error")
+
+
 class TestDeltaSyncCalendar:
     @pytest.mark.asyncio
-    async def test_delta_sync_calendar_success(self, mock_context, mock_calendar_event):
+    async def test_delta_sync_calendar_success(self, mock_context, mock_calendar_event, delta_sync_mocks):
         """Test successful calendar delta sync."""
-        with patch('calendar_module.delta_sync.get_calendar_sync_token', return_value="test_token"), \
-             patch('calendar_module.delta_sync.get_creds', new_callable=AsyncMock) as mock_creds, \
-             patch('calendar_module.delta_sync.build') as mock_build, \
-             patch('calendar_module.delta_sync.get_vector_store') as mock_get_store, \
-             patch('calendar_module.delta_sync.barrier', new_callable=AsyncMock) as mock_barrier, \
-             patch('calendar_module.delta_sync.set_calendar_sync_token') as mock_set_token:
-            
-            # Setup mocks
-            mock_service = Mock()
-            mock_events = Mock()
-            mock_service.events.return_value = mock_events
-            mock_events.list.return_value.execute.return_value = {
-                "items": [mock_calendar_event],
-                "nextSyncToken": "new_sync_token"
-            }
-            mock_build.return_value = mock_service
-            
-            mock_store = Mock()
-            mock_store.add_documents = Mock()
-            mock_get_store.return_value = mock_store
-            
-            # Execute
-            await delta_sync_calendar(mock_context)
-            
-            # Verify API calls
-            mock_events.list.assert_called_once_with(
-                calendarId="test_calendar@example.com",
-                syncToken="test_token",
-                showDeleted=True,
-                pageToken=None
-            )
-            
-            # Verify document creation and storage
-            mock_store.add_documents.assert_called_once()
-            args, kwargs = mock_store.add_documents.call_args
-            docs = args[0]
-            assert len(docs) == 1
-            assert docs[0].metadata["id"] == "event_123"
-            assert docs[0].metadata["type"] == "event"
-            assert "Test Meeting" in docs[0].page_content
-            
-            # Verify sync token update
-            mock_set_token.assert_called_once_with("new_sync_token")
+        # Setup mocks
+        mock_events = Mock()
+        mock_events.list.return_value.execute.return_value = {
+            "items": [mock_calendar_event],
+            "nextSyncToken": "new_sync_token"
+        }
+        delta_sync_mocks.build.return_value = _calendar_service(events=mock_events)
+        
+        mock_store = Mock()
+        delta_sync_mocks.get_vector_store.return_value = mock_store
+        
+        # Execute
+        await delta_sync_calendar(mock_context)
+        
+        # Verify API calls
+        mock_events.list.assert_called_once_with(
+            calendarId="test_calendar@example.com",
+            syncToken="test_token",
+            showDeleted=True,
+            pageToken=None
+        )
+        
+        # Verify document creation and storage
+        mock_store.add_documents.assert_called_once()
+        args, kwargs = mock_store.add_documents.call_args
+        docs = args[0]
+        assert len(docs) == 1
+        assert docs[0].metadata["id"] == "event_123"
+        assert docs[0].metadata["type"] == "event"
+        assert "Test Meeting" in docs[0].page_content
+        
+        # Verify sync token update
+        delta_sync_mocks.set_calendar_sync_token.assert_called_once_with("new_sync_token")
 
     @pytest.mark.asyncio
-    async def test_delta_sync_calendar_cancelled_event(self, mock_context):
+    async def test_delta_sync_calendar_cancelled_event(self, mock_context, delta_sync_mocks):
         """Test delta sync handles cancelled events."""
         cancelled_event = {
             "id": "cancelled_event",
             "status": "cancelled"
         }
         
-        with patch('calendar_module.delta_sync.get_calendar_sync_token', return_value="test_token"), \
-             patch('calendar_module.delta_sync.get_creds', new_callable=AsyncMock), \
-             patch('calendar_module.delta_sync.build') as mock_build, \
-             patch('calendar_module.delta_sync.get_vector_store') as mock_get_store, \
-             patch('calendar_module.delta_sync.safe_delete') as mock_safe_delete, \
-             patch('calendar_module.delta_sync.barrier', new_callable=AsyncMock):
-            
-            # Setup mocks
-            mock_service = Mock()
-            mock_events = Mock()
-            mock_service.events.return_value = mock_events
-            mock_events.list.return_value.execute.return_value = {
-                "items": [cancelled_event],
-                "nextSyncToken": "new_sync_token"
-            }
-            mock_build.return_value = mock_service
-            
-            mock_store = Mock()
-            mock_get_store.return_value = mock_store
-            
-            # Execute
-            await delta_sync_calendar(mock_context)
-            
-            # Verify deletion
-            mock_safe_delete.assert_called_once_with(mock_store, ["cancelled_event"])
+        # Setup mocks
+        delta_sync_mocks.build.return_value = _calendar_service([cancelled_event], "new_sync_token")
+        
+        mock_store = SimpleNamespace()
+        delta_sync_mocks.get_vector_store.return_value = mock_store
+        
+        # Execute
+        await delta_sync_calendar(mock_context)
+        
+        # Verify deletion
+        delta_sync_mocks.safe_delete.assert_called_once_with(mock_store, ["cancelled_event"])
 
 
 class TestDeltaSyncTasks:
     @pytest.mark.asyncio
-    async def test_delta_sync_tasks_with_time_parsing(self, mock_context):
+    async def test_delta_sync_tasks_with_time_parsing(self, mock_context, delta_sync_mocks):
         """Test task sync with time parsing from title."""
         task_with_time = {
             "id": "task_123",
@@ -264,40 +309,26 @@ class TestDeltaSyncTasks:
             "due": "2025-05-30T00:00:00.000Z"
         }
         
-        with patch('calendar_module.delta_sync.get_tasks_last_updated', return_value="2025-05-29T00:00:00Z"), \
-             patch('calendar_module.delta_sync.get_creds', new_callable=AsyncMock), \
-             patch('calendar_module.delta_sync.build') as mock_build, \
-             patch('calendar_module.delta_sync.get_vector_store') as mock_get_store, \
-             patch('calendar_module.delta_sync.barrier', new_callable=AsyncMock), \
-             patch('calendar_module.delta_sync.set_tasks_last_updated') as mock_set_updated:
-            
-            # Setup mocks
-            mock_service = Mock()
-            mock_tasks = Mock()
-            mock_service.tasks.return_value = mock_tasks
-            mock_tasks.list.return_value.execute.return_value = {
-                "items": [task_with_time]
-            }
-            mock_build.return_value.tasks.return_value = mock_tasks
-            
-            mock_store = Mock()
-            mock_store.add_documents = Mock()
-            mock_get_store.return_value = mock_store
-            
-            # Execute
-            await delta_sync_tasks(mock_context)
-            
-            # Verify document creation
-            mock_store.add_documents.assert_called_once()
-            args, kwargs = mock_store.add_documents.call_args
-            docs = args[0]
-            assert len(docs) == 1
-            assert docs[0].metadata["id"] == "task_123"
-            assert docs[0].metadata["type"] == "task"
-            assert "Meeting at 3:30pm" in docs[0].page_content
+        # Setup mocks
+        delta_sync_mocks.build.return_value = _tasks_service([task_with_time])
+        
+        mock_store = Mock()
+        delta_sync_mocks.get_vector_store.return_value = mock_store
+        
+        # Execute
+        await delta_sync_tasks(mock_context)
+        
+        # Verify document creation
+        mock_store.add_documents.assert_called_once()
+        args, kwargs = mock_store.add_documents.call_args
+        docs = args[0]
+        assert len(docs) == 1
+        assert docs[0].metadata["id"] == "task_123"
+        assert docs[0].metadata["type"] == "task"
+        assert "Meeting at 3:30pm" in docs[0].page_content
 
     @pytest.mark.asyncio
-    async def test_delta_sync_tasks_no_due_date(self, mock_context):
+    async def test_delta_sync_tasks_no_due_date(self, mock_context, delta_sync_mocks):
         """Test task sync with tasks that have no due date."""
         floating_task = {
             "id": "floating_task",
@@ -305,40 +336,27 @@ class TestDeltaSyncTasks:
             "notes": "No deadline"
         }
         
-        with patch('calendar_module.delta_sync.get_tasks_last_updated', return_value="2025-05-29T00:00:00Z"), \
-             patch('calendar_module.delta_sync.get_creds', new_callable=AsyncMock), \
-             patch('calendar_module.delta_sync.build') as mock_build, \
-             patch('calendar_module.delta_sync.get_vector_store') as mock_get_store, \
-             patch('calendar_module.delta_sync.barrier', new_callable=AsyncMock):
-            
-            # Setup mocks
-            mock_service = Mock()
-            mock_tasks = Mock()
-            mock_service.tasks.return_value = mock_tasks
-            mock_tasks.list.return_value.execute.return_value = {
-                "items": [floating_task]
-            }
-            mock_build.return_value.tasks.return_value = mock_tasks
-            
-            mock_store = Mock()
-            mock_store.add_documents = Mock()
-            mock_get_store.return_value = mock_store
-            
-            # Execute
-            await delta_sync_tasks(mock_context)
-            
-            # Verify document creation for floating task
-            mock_store.add_documents.assert_called_once()
-            args, kwargs = mock_store.add_documents.call_args
-            docs = args[0]
-            assert len(docs) == 1
-            assert docs[0].metadata["id"] == "floating_task"
-            assert docs[0].metadata["type"] == "task"
-            # Should not have start_dt or end_dt for floating tasks
-            assert "start_dt" not in docs[0].metadata or docs[0].metadata["start_dt"] is None
+        # Setup mocks
+        delta_sync_mocks.build.return_value = _tasks_service([floating_task])
+        
+        mock_store = Mock()
+        delta_sync_mocks.get_vector_store.return_value = mock_store
+        
+        # Execute
+        await delta_sync_tasks(mock_context)
+        
+        # Verify document creation for floating task
+        mock_store.add_documents.assert_called_once()
+        args, kwargs = mock_store.add_documents.call_args
+        docs = args[0]
+        assert len(docs) == 1
+        assert docs[0].metadata["id"] == "floating_task"
+        assert docs[0].metadata["type"] == "task"
+        # Should not have start_dt or end_dt for floating tasks
+        assert "start_dt" not in docs[0].metadata or docs[0].metadata["start_dt"] is None
 
     @pytest.mark.asyncio
-    async def test_delta_sync_tasks_completed_deleted(self, mock_context):
+    async def test_delta_sync_tasks_completed_deleted(self, mock_context, delta_sync_mocks):
         """Test task sync handles completed/deleted tasks."""
         completed_task = {
             "id": "completed_task",
@@ -352,124 +370,68 @@ class TestDeltaSyncTasks:
             "deleted": True
         }
         
-        with patch('calendar_module.delta_sync.get_tasks_last_updated', return_value="2025-05-29T00:00:00Z"), \
-             patch('calendar_module.delta_sync.get_creds', new_callable=AsyncMock), \
-             patch('calendar_module.delta_sync.build') as mock_build, \
-             patch('calendar_module.delta_sync.get_vector_store') as mock_get_store, \
-             patch('calendar_module.delta_sync.safe_delete') as mock_safe_delete, \
-             patch('calendar_module.delta_sync.barrier', new_callable=AsyncMock):
-            
-            # Setup mocks
-            mock_service = Mock()
-            mock_tasks = Mock()
-            mock_service.tasks.return_value = mock_tasks
-            mock_tasks.list.return_value.execute.return_value = {
-                "items": [completed_task, deleted_task]
-            }
-            mock_build.return_value.tasks.return_value = mock_tasks
-            
-            mock_store = Mock()
-            mock_get_store.return_value = mock_store
-            
-            # Execute
-            await delta_sync_tasks(mock_context)
-            
-            # Verify both tasks are deleted
-            mock_safe_delete.assert_called_once_with(mock_store, ["completed_task", "deleted_task"])
+        # Setup mocks
+        delta_sync_mocks.build.return_value = _tasks_service([completed_task, deleted_task])
+        
+        mock_store = SimpleNamespace()
+        delta_sync_mocks.get_vector_store.return_value = mock_store
+        
+        # Execute
+        await delta_sync_tasks(mock_context)
+        
+        # Verify both tasks are deleted
+        delta_sync_mocks.safe_delete.assert_called_once_with(mock_store, ["completed_task", "deleted_task"])
 
 
 class TestDeltaSyncErrorHandling:
     @pytest.mark.asyncio
-    async def test_delta_sync_calendar_upsert_error(self, mock_context, mock_calendar_event):
+    async def test_delta_sync_calendar_upsert_error(self, mock_context, mock_calendar_event, delta_sync_mocks):
         """Test delta sync handles upsert errors gracefully."""
-        with patch('calendar_module.delta_sync.get_calendar_sync_token', return_value="test_token"), \
-             patch('calendar_module.delta_sync.get_creds', new_callable=AsyncMock), \
-             patch('calendar_module.delta_sync.build') as mock_build, \
-             patch('calendar_module.delta_sync.get_vector_store') as mock_get_store, \
-             patch('calendar_module.delta_sync.barrier', new_callable=AsyncMock):
-            
-            # Setup mocks
-            mock_service = Mock()
-            mock_events = Mock()
-            mock_service.events.return_value = mock_events
-            mock_events.list.return_value.execute.return_value = {
-                "items": [mock_calendar_event],
-                "nextSyncToken": "new_sync_token"
-            }
-            mock_build.return_value = mock_service
-            
-            mock_store = Mock()
-            mock_store.add_documents.side_effect = Exception("Pinecone error")
-            mock_get_store.return_value = mock_store
-            
-            # Should not raise exception
-            await delta_sync_calendar(mock_context)
+        # Setup mocks
+        delta_sync_mocks.build.return_value = _calendar_service([mock_calendar_event], "new_sync_token")
+        
+        delta_sync_mocks.get_vector_store.return_value = SimpleNamespace(add_documents=_failing_upsert)
+        
+        # Should not raise exception
+        await delta_sync_calendar(mock_context)
 
     @pytest.mark.asyncio
-    async def test_delta_sync_tasks_upsert_error(self, mock_context, mock_task):
+    async def test_delta_sync_tasks_upsert_error(self, mock_context, mock_task, delta_sync_mocks):
         """Test task delta sync handles upsert errors gracefully."""
-        with patch('calendar_module.delta_sync.get_tasks_last_updated', return_value="2025-05-29T00:00:00Z"), \
-             patch('calendar_module.delta_sync.get_creds', new_callable=AsyncMock), \
-             patch('calendar_module.delta_sync.build') as mock_build, \
-             patch('calendar_module.delta_sync.get_vector_store') as mock_get_store, \
-             patch('calendar_module.delta_sync.barrier', new_callable=AsyncMock):
-            
-            # Setup mocks
-            mock_service = Mock()
-            mock_tasks = Mock()
-            mock_service.tasks.return_value = mock_tasks
-            mock_tasks.list.return_value.execute.return_value = {
-                "items": [mock_task]
-            }
-            mock_build.return_value.tasks.return_value = mock_tasks
-            
-            mock_store = Mock()
-            mock_store.add_documents.side_effect = Exception("Pinecone error")
-            mock_get_store.return_value = mock_store
-            
-            # Should not raise exception
-            await delta_sync_tasks(mock_context)
+        # Setup mocks
+        delta_sync_mocks.build.return_value = _tasks_service([mock_task])
+        
+        delta_sync_mocks.get_vector_store.return_value = SimpleNamespace(add_documents=_failing_upsert)
+        
+        # Should not raise exception
+        await delta_sync_tasks(mock_context)
 
 
 class TestDeltaSyncCalendarErrorHandling:
     """Test error handling scenarios in delta_sync_calendar."""
 
     @pytest.mark.asyncio
-    async def test_delta_sync_calendar_http_410_error(self, mock_context):
+    async def test_delta_sync_calendar_http_410_error(self, mock_context, delta_sync_mocks):
         """Test calendar delta sync handles HTTP 410 (sync token expired) correctly."""
-        with patch('calendar_module.delta_sync.get_calendar_sync_token', return_value="expired_token"), \
-             patch('calendar_module.delta_sync.set_calendar_sync_token') as mock_set_token, \
-             patch('calendar_module.delta_sync.get_creds', new_callable=AsyncMock), \
-             patch('calendar_module.delta_sync.build') as mock_build, \
-             patch('calendar_module.delta_sync.get_vector_store') as mock_get_store, \
-             patch('calendar_module.delta_sync.barrier', new_callable=AsyncMock):
-            
-            # Create a mock HTTP 410 error response
-            mock_resp = Mock()
-            mock_resp.status = 410
-            http_410_error = HttpError(resp=mock_resp, content=b'{"error": {"message": "sync token no longer valid"}}')
-            
-            # Setup mocks
-            mock_service = Mock()
-            mock_events = Mock()
-            mock_service.events.return_value = mock_events
-            
-            # First call raises HTTP 410, second call succeeds (simulating fresh sync)
-            mock_events.list.return_value.execute.side_effect = [
-                http_410_error,  # First call with expired token
-                {"items": [], "nextSyncToken": "new_token"}  # Second call after token reset
-            ]
-            mock_build.return_value = mock_service
-            
-            mock_store = Mock()
-            mock_get_store.return_value = mock_store
-            
-            # Execute the function
-            await delta_sync_calendar(mock_context)
-            
-            # Verify that the sync token was reset and function was called recursively
-            # Should be called twice: first to reset (None), then to set new token ("new_token")
-            expected_calls = [call(None), call("new_token")]
-            mock_set_token.assert_has_calls(expected_calls)
-            # Should have been called twice: once with expired token (fails), once with empty token (succeeds)
-            assert mock_events.list.return_value.execute.call_count == 2
+        delta_sync_mocks.get_calendar_sync_token.return_value = "expired_token"
+        
+        # Setup mocks
+        mock_events = Mock()
+        
+        # First call raises HTTP 410, second call succeeds (simulating fresh sync)
+        mock_events.list.return_value.execute.side_effect = iter([
+            _HTTP_410,  # First call with expired token
+            {"items": [], "nextSyncToken": "new_token"}  # Second call after token reset
+        ])
+        delta_sync_mocks.build.return_value = _calendar_service(events=mock_events)
+        
+        delta_sync_mocks.get_vector_store.return_value = SimpleNamespace()
+        
+        # Execute the function
+        await delta_sync_calendar(mock_context)
+        
+        # Verify that the sync token was reset and function was called recursively
+        # Should be called twice: first to reset (None), then to set new token ("new_token")
+        assert delta_sync_mocks.set_calendar_sync_token.call_args_list == [call(None), call("new_token")]
+        # Should have been called twice: once with expired token (fails), once with empty token (succeeds)
+        assert mock_events.list.return_value.execute.call_count == 2
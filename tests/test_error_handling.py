@@ -1,9 +1,11 @@
 # tests/test_error_handling.py
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
-import tempfile
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 import json
-from pathlib import Path
+
+# Input for the reranker truncation check; built once at import
+_LONG_TEXT = "word " * 1000
 
 class TestErrorHandling:
     """Test error handling throughout the application."""
@@ -42,18 +44,10 @@ class TestErrorHandling:
     
     def test_malformed_tenants_json(self):
         """Test handling of malformed tenants.json."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            f.write("invalid json content {{{")
-            temp_path = f.name
+        malformed = "invalid json content {{{"
         
-        try:
-            with patch('settings.settings.tenants_file', temp_path):
-                with pytest.raises(json.JSONDecodeError):
-                    # This should trigger JSON parsing error
-                    with open(temp_path, 'r') as file:
-                        json.loads(file.read())
-        finally:
-            Path(temp_path).unlink()
+        with pytest.raises(json.JSONDecodeError):
+            json.loads(malformed)
     
     @pytest.mark.asyncio
     async def test_query_parser_openai_error(self):
@@ -83,22 +77,19 @@ class TestErrorHandling:
             epoch_from_iso("invalid")
         # The current implementation will raise ValueError for invalid ISO strings
     
-    def test_html_to_discord_md_malformed_html(self):
+    @pytest.mark.parametrize("case", [
+        '<a href="no-closing-quote>Link</a>',
+        '<a href=>Empty href</a>',
+        '<a>No href attribute</a>',
+        'Regular text with < and > symbols',
+    ], ids=["no-closing-quote", "empty-href", "no-href", "bare-angle-brackets"])
+    def test_html_to_discord_md_malformed_html(self, case):
         """Test HTML conversion with malformed HTML."""
         from utils.calendar_utils import html_to_discord_md
         
-        # Test with unclosed tags, malformed attributes, etc.
-        malformed_cases = [
-            '<a href="no-closing-quote>Link</a>',
-            '<a href=>Empty href</a>',
-            '<a>No href attribute</a>',
-            'Regular text with < and > symbols',
-        ]
-        
-        for case in malformed_cases:
-            # Should not crash, even with malformed HTML
-            result = html_to_discord_md(case)
-            assert isinstance(result, str)
+        # Should not crash, even with malformed HTML
+        result = html_to_discord_md(case)
+        assert isinstance(result, str)
 
 class TestEdgeCases:
     """Test edge cases and boundary conditions."""
@@ -133,8 +124,7 @@ class TestEdgeCases:
         assert result.strip() == ""
         
         # Very long text
-        long_text = "word " * 1000
-        result = _clean(long_text, max_tokens=5)
+        result = _clean(_LONG_TEXT, max_tokens=5)
         assert len(result) <= 25  # 5 tokens * 4 chars + possible ellipsis
     
     @pytest.mark.asyncio
@@ -142,22 +132,23 @@ class TestEdgeCases:
         """Test handling of directory creation failures."""
         from tenant_context import load_tenant_context
         
-        with patch('tenant_context.TENANT_CONFIGS') as mock_configs:
-            mock_tenant = MagicMock()
-            mock_tenant.guild_id = 111
-            mock_tenant.channels = {222: MagicMock()}
-            mock_tenant.model_dump.return_value = {
+        # Only the attributes load_tenant_context reads for an uncategorized channel
+        tenant = SimpleNamespace(
+            guild_id=111,
+            model_dump=lambda: {
                 "guild_id": 111,
                 "name": "test",
                 "data_dir": "/invalid/path/that/cannot/be/created",
                 "vector_store_path": "/another/invalid/path"
-            }
-            mock_tenant.channels[222].model_dump.return_value = {
-                "name": "test-channel",
-                "type": "rag"
-            }
-            mock_configs.__iter__.return_value = [mock_tenant]
-            
+            },
+            channel_overrides={},
+            category_permissions={},
+            default_features=["rag"],
+            default_data_dir_template="/invalid/path/that/cannot/be/created/{channel_id}",
+            default_vector_store_template="/another/invalid/path/{channel_id}",
+        )
+        
+        with patch('tenant_context.TENANT_CONFIGS', [tenant]):
             with patch('tenant_context.Path') as mock_path:
                 mock_path.return_value.mkdir.side_effect = PermissionError("Cannot create directory")
                 
@@ -1,101 +1,100 @@
 # tests/test_handlers.py
 import pytest
-from unittest.mock import AsyncMock, patch
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import AsyncMock, Mock
 
-pytestmark = pytest.mark.asyncio
+from calendar_module import calendar_handler
+from calendar_module.calendar_handler import respond as cal_respond
+from fallback_module.fallback_handler import respond as fb_respond
+from rag_module.rag_handler_optimized import respond as rag_respond
+
+# Hybrid search candidates; the mocked reranker drops them unread, so a
+# duck-typed stand-in is enough
+_MEETING_CANDIDATE = SimpleNamespace(
+    page_content="Meeting Title\nMeeting description",
+    metadata={"id": "event1", "type": "event"}
+)
+_WEAK_CANDIDATE = SimpleNamespace(
+    page_content="Somewhat Related\nWeak match content",
+    metadata={"id": "event1", "type": "event"}
+)
+
+@pytest.fixture(scope="session")
+def mock_context():
+    """Calendar channel context, shared read-only; respond() never mutates it."""
+    return MappingProxyType({
+        "guild_id": 111,
+        "name": "test-channel",
+        "type": "calendar",
+        "timezone": "America/Toronto",
+        "calendar_id": "test@example.com",
+        "tasklist_id": "test123"
+    })
+
+@pytest.fixture
+def calendar_handler_mocks(monkeypatch):
+    """Patch the calendar pipeline stages and return the mocks by name.
+
+    Tests configure parse_query's result and the search/rerank outputs on the
+    returned handles; sync stages are awaited no-ops.
+    """
+    mocks = SimpleNamespace(
+        parse_query=AsyncMock(),
+        delta_sync_calendar=AsyncMock(),
+        delta_sync_tasks=AsyncMock(),
+        ensure_synced=AsyncMock(),
+        hybrid_search_relative_band=Mock(),
+        rerank_llm=Mock(),
+        _index=Mock(),
+    )
+    for name, mock in vars(mocks).items():
+        monkeypatch.setattr(calendar_handler, name, mock)
+    return mocks
 
 class TestRAGHandler:
     """Test RAG module handler."""
     
     async def test_rag_respond_basic(self):
         """Test basic RAG response functionality."""
-        from rag_module.rag_handler_optimized import respond as rag_respond
+        context = {
+            "tenant_id": "test_tenant",
+            "guild_id": "123456789",
+            "channel_id": "987654321",
+            "name": "test-channel", 
+            "type": "rag",
+            "timezone": "UTC",
+            "index_rag": "calendar-hybrid",  # Required for validation
+            "s3_bucket": "test-bucket",
+            "s3_raw_docs_prefix": "raw_docs/test/",
+            "s3_image_prefix": "images/test/"
+        }
+        query = "What is machine learning?"
         
-        # Mock the ingest_pipeline to avoid S3 calls - optimized handler has different structure
-        with patch('rag_module.ingest_pipeline.ingest_pipeline', new_callable=AsyncMock) as mock_ingest:
-            mock_ingest.return_value = None  # No documents to ingest
-            
-            context = {
-                "tenant_id": "test_tenant",
-                "guild_id": "123456789",
-                "channel_id": "987654321",
-                "name": "test-channel", 
-                "type": "rag",
-                "timezone": "UTC",
-                "index_rag": "calendar-hybrid",  # Required for validation
-                "s3_bucket": "test-bucket",
-                "s3_raw_docs_prefix": "raw_docs/test/",
-                "s3_image_prefix": "images/test/"
-            }
-            query = "What is machine learning?"
-            
-            result = await rag_respond(query, context, user_id="test_user")
-            
-            # The optimized implementation returns a formatted response string
-            assert isinstance(result, str)
-            assert len(result) > 0
-            # Should contain helpful response when no documents found
-            assert "information" in result.lower() or "materials" in result.lower()
+        result = await rag_respond(query, context, user_id="test_user")
+        
+        # The optimized implementation returns a formatted response string
+        assert isinstance(result, str)
+        assert len(result) > 0
+        # Should contain helpful response when no documents found
+        assert "information" in result.lower() or "materials" in result.lower()
 
 class TestCalendarHandler:
     """Test Calendar module handler - integration test."""
     
-    @pytest.fixture
-    def mock_context(self):
-        """Mock context for calendar tests."""
-        return {
-            "guild_id": 111,
-            "name": "test-channel",
-            "type": "calendar",
-            "timezone": "America/Toronto",
-            "calendar_id": "test@example.com",
-            "tasklist_id": "test123"
-        }
-    
-    async def test_non_applicable_query(self, mock_context):
+    async def test_non_applicable_query(self, mock_context, calendar_handler_mocks):
         """Test calendar handler with non-applicable query."""
-        from calendar_module.calendar_handler import respond as cal_respond
-        
         # Mock the parse_query to return non-applicable
-        with patch('calendar_module.calendar_handler.parse_query') as mock_parse:
-            mock_parse.return_value.applicable = False
-            
-            result = await cal_respond("How are you?", mock_context)
-            
-            assert "not applicable" in result.lower()
-    
-    async def test_empty_results(self, mock_context):
-        """Test calendar handler with no search results."""
-        from calendar_module.calendar_handler import respond as cal_respond
+        calendar_handler_mocks.parse_query.return_value.applicable = False
+        
+        result = await cal_respond("How are you?", mock_context)
         
-        # Mock all the dependencies
-        with patch('calendar_module.calendar_handler.parse_query') as mock_parse, \
-             patch('calendar_module.calendar_handler.delta_sync_calendar') as mock_delta_cal, \
-             patch('calendar_module.calendar_handler.delta_sync_tasks') as mock_delta_tasks, \
-             patch('calendar_module.calendar_handler.ensure_synced') as mock_sync, \
-             patch('calendar_module.calendar_handler.hybrid_search_relative_band') as mock_search:
-            
-            # Setup mocks
-            mock_parse.return_value.applicable = True
-            mock_parse.return_value.type = "event"
-            mock_parse.return_value.date_from = "2025-05-28T00:00:00-04:00"
-            mock_parse.return_value.date_to = "2025-06-28T23:59:59-04:00"
-            mock_parse.return_value.filter = "meeting"
-            mock_parse.return_value.limit = 10
-            
-            mock_search.return_value = []  # No results
-            
-            result = await cal_respond("meeting today", mock_context)
-            
-            assert "No results found" in result
+        assert "not applicable" in result.lower()
 
 class TestFallbackHandler:
     """Test Fallback module handler."""
     
     async def test_fallback_respond_basic(self):
         """Test basic fallback response functionality."""
-        from fallback_module.fallback_handler import respond as fb_respond
-        
         context = {"name": "test-channel", "type": "fallback"}
         query = "How are you today?"
         
@@ -109,149 +108,39 @@ class TestFallbackHandler:
 class TestCalendarHandlerEdgeCases:
     """Test Calendar module handler edge cases and complete pipeline scenarios."""
     
-    @pytest.fixture
-    def mock_context(self):
-        """Mock context for calendar tests."""
-        return {
-            "guild_id": 111,
-            "name": "test-channel",
-            "type": "calendar", 
-            "timezone": "America/Toronto",
-            "calendar_id": "test@example.com",
-            "tasklist_id": "test123"
-        }
-
-    async def test_window_only_query_no_results(self, mock_context):
-        """Test window-only query (no text filter) with no matching events."""
-        from calendar_module.calendar_handler import respond as cal_respond
+    @pytest.mark.parametrize("query, filter_text, candidates, reranked", [
+        # Window-only query: empty filter skips semantic search, index has no matches
+        ("today", "", None, None),
+        ("meeting today", "meeting", [], None),
+        ("nonexistent meeting today", "nonexistent meeting", [], None),
+        # Reranker rejects every candidate hybrid search found
+        ("irrelevant query today", "irrelevant query", [_MEETING_CANDIDATE], []),
+        ("vague query", "vague query", [_WEAK_CANDIDATE], []),
+    ], ids=["window_only", "empty_results", "semantic_no_candidates",
+            "reranker_rejects_all", "single_weak_match"])
+    async def test_no_results(self, mock_context, calendar_handler_mocks, query, filter_text, candidates, reranked):
+        """Test each pipeline path that ends with no results to show."""
+        parsed = calendar_handler_mocks.parse_query.return_value
+        parsed.applicable = True
+        parsed.type = "event"
+        parsed.date_from = "2025-05-28T00:00:00-04:00"
+        parsed.date_to = "2025-06-28T23:59:59-04:00"
+        parsed.filter = filter_text
+        parsed.limit = 10
         
-        # Mock all dependencies
-        with patch('calendar_module.calendar_handler.parse_query') as mock_parse, \
-             patch('calendar_module.calendar_handler.delta_sync_calendar') as mock_delta_cal, \
-             patch('calendar_module.calendar_handler.delta_sync_tasks') as mock_delta_tasks, \
-             patch('calendar_module.calendar_handler.ensure_synced') as mock_sync, \
-             patch('calendar_module.calendar_handler._index') as mock_index:
-            
-            # Setup mocks for window-only query (no filter text)
-            mock_parse.return_value.applicable = True
-            mock_parse.return_value.type = "event"
-            mock_parse.return_value.date_from = "2025-05-28T00:00:00-04:00"
-            mock_parse.return_value.date_to = "2025-06-28T23:59:59-04:00"
-            mock_parse.return_value.filter = ""  # Empty filter = window-only
-            mock_parse.return_value.limit = 10
-            
-            # Mock index query to return no matches
-            mock_index.query.return_value = {"matches": []}
-            
-            result = await cal_respond("today", mock_context)
-            
-            assert "No results found" in result
-
-    async def test_semantic_search_no_candidates(self, mock_context):
-        """Test semantic search when hybrid search returns no candidates."""
-        from calendar_module.calendar_handler import respond as cal_respond
+        calendar_handler_mocks._index.query.return_value = {"matches": []}
+        calendar_handler_mocks.hybrid_search_relative_band.return_value = candidates
+        calendar_handler_mocks.rerank_llm.return_value = reranked
         
-        with patch('calendar_module.calendar_handler.parse_query') as mock_parse, \
-             patch('calendar_module.calendar_handler.delta_sync_calendar') as mock_delta_cal, \
-             patch('calendar_module.calendar_handler.delta_sync_tasks') as mock_delta_tasks, \
-             patch('calendar_module.calendar_handler.ensure_synced') as mock_sync, \
-             patch('calendar_module.calendar_handler.hybrid_search_relative_band') as mock_search:
-            
-            # Setup mocks for semantic search (with filter text)
-            mock_parse.return_value.applicable = True
-            mock_parse.return_value.type = "event"
-            mock_parse.return_value.date_from = "2025-05-28T00:00:00-04:00"
-            mock_parse.return_value.date_to = "2025-06-28T23:59:59-04:00"
-            mock_parse.return_value.filter = "nonexistent meeting"
-            mock_parse.return_value.limit = 10
-            
-            # Mock hybrid search to return no candidates
-            mock_search.return_value = []
-            
-            result = await cal_respond("nonexistent meeting today", mock_context)
-            
-            assert "No results found" in result
-
-    async def test_reranker_rejects_all_candidates(self, mock_context):
-        """Test when reranker rejects all candidates (returns empty list)."""
-        from calendar_module.calendar_handler import respond as cal_respond
-        from langchain_core.documents import Document
+        result = await cal_respond(query, mock_context)
         
-        with patch('calendar_module.calendar_handler.parse_query') as mock_parse, \
-             patch('calendar_module.calendar_handler.delta_sync_calendar') as mock_delta_cal, \
-             patch('calendar_module.calendar_handler.delta_sync_tasks') as mock_delta_tasks, \
-             patch('calendar_module.calendar_handler.ensure_synced') as mock_sync, \
-             patch('calendar_module.calendar_handler.hybrid_search_relative_band') as mock_search, \
-             patch('calendar_module.calendar_handler.rerank_llm') as mock_rerank:
-            
-            # Setup mocks
-            mock_parse.return_value.applicable = True
-            mock_parse.return_value.type = "event"
-            mock_parse.return_value.date_from = "2025-05-28T00:00:00-04:00"
-            mock_parse.return_value.date_to = "2025-06-28T23:59:59-04:00"
-            mock_parse.return_value.filter = "irrelevant query"
-            mock_parse.return_value.limit = 10
-            
-            # Mock hybrid search to return some candidates
-            mock_candidates = [
-                Document(
-                    page_content="Meeting Title\nMeeting description",
-                    metadata={"id": "event1", "type": "event"}
-                )
-            ]
-            mock_search.return_value = mock_candidates
-            
-            # Mock reranker to reject all candidates
-            mock_rerank.return_value = []
-            
-            result = await cal_respond("irrelevant query today", mock_context)
-            
-            assert "No results found" in result
+        assert "No results found" in result
 
-    async def test_single_weak_match_pipeline(self, mock_context):
-        """Test complete pipeline with single weak match that gets filtered."""
-        from calendar_module.calendar_handler import respond as cal_respond
-        from langchain_core.documents import Document
-        
-        with patch('calendar_module.calendar_handler.parse_query') as mock_parse, \
-             patch('calendar_module.calendar_handler.delta_sync_calendar') as mock_delta_cal, \
-             patch('calendar_module.calendar_handler.delta_sync_tasks') as mock_delta_tasks, \
-             patch('calendar_module.calendar_handler.ensure_synced') as mock_sync, \
-             patch('calendar_module.calendar_handler.hybrid_search_relative_band') as mock_search, \
-             patch('calendar_module.calendar_handler.rerank_llm') as mock_rerank:
-            
-            # Setup mocks
-            mock_parse.return_value.applicable = True
-            mock_parse.return_value.type = "event"
-            mock_parse.return_value.date_from = "2025-05-28T00:00:00-04:00"
-            mock_parse.return_value.date_to = "2025-06-28T23:59:59-04:00"
-            mock_parse.return_value.filter = "vague query"
-            mock_parse.return_value.limit = 10
-            
-            # Mock hybrid search returns one weak candidate (but passes through)
-            mock_candidates = [
-                Document(
-                    page_content="Somewhat Related\nWeak match content",
-                    metadata={"id": "event1", "type": "event"}
-                )
-            ]
-            mock_search.return_value = mock_candidates
-            
-            # Mock reranker to reject the weak candidate
-            mock_rerank.return_value = []
-            
-            result = await cal_respond("vague query", mock_context)
-            
-            assert "No results found" in result
-
-    async def test_empty_query_edge_case(self, mock_context):
+    async def test_empty_query_edge_case(self, mock_context, calendar_handler_mocks):
         """Test handling of completely empty queries."""
-        from calendar_module.calendar_handler import respond as cal_respond
+        # Mock parser to return non-applicable for empty query
+        calendar_handler_mocks.parse_query.return_value.applicable = False
+        
+        result = await cal_respond("", mock_context)
         
-        with patch('calendar_module.calendar_handler.parse_query') as mock_parse:
-            # Mock parser to return non-applicable for empty query
-            mock_parse.return_value.applicable = False
-            
-            result = await cal_respond("", mock_context)
-            
-            assert "not applicable" in result.lower()
+        assert "not applicable" in result.lower()
@@ -0,0 +1,52 @@
+# tests/test_rate_limiter.py
+import pytest
+from unittest.mock import Mock
+
+from rag_module.rate_limiter import DailyRateLimiter, RateLimitConfig
+
+
+@pytest.fixture
+def mock_supabase():
+    """Mock Supabase client whose RPC returns a single count row."""
+    client = Mock()
+    client.rpc.return_value.execute.return_value = Mock(data=[{"current_count": 3}])
+    return client
+
+
+@pytest.fixture
+def limiter(mock_supabase):
+    return DailyRateLimiter(mock_supabase, RateLimitConfig())
+
+
+class TestCheckUserLimit:
+    async def test_check_user_limit_within_limit(self, limiter, mock_supabase):
+        """Test a valid check reads the count from Supabase."""
+        result = await limiter.check_user_limit("12345", "rag_requests")
+
+        assert result.allowed is True
+        assert result.is_error is False
+        assert result.current_count == 3
+        assert result.daily_limit == 10
+        mock_supabase.rpc.assert_called_once_with(
+            'check_user_limit', {'p_user_id': "12345", 'p_limit_type': "rag_requests"}
+        )
+
+    @pytest.mark.parametrize("user_id, limit_type", [("", "rag_requests"), ("12345", "bogus")])
+    async def test_check_user_limit_invalid_input(self, limiter, mock_supabase, user_id, limit_type):
+        """Test invalid input is rejected without calling Supabase."""
+        result = await limiter.check_user_limit(user_id, limit_type)
+
+        assert result.allowed is False
+        assert result.is_error is True
+        mock_supabase.rpc.assert_not_called()
+
+    async def test_check_user_limit_no_data_fails_open(self, limiter, mock_supabase):
+        """Test an empty RPC response allows the request under the checked type's limit."""
+        mock_supabase.rpc.return_value.execute.return_value = Mock(data=[])
+
+        result = await limiter.check_user_limit("12345", "file_uploads")
+
+        assert result.allowed is True
+        assert result.is_error is False
+        assert result.daily_limit == 5
+        assert "allowing request" in result.message
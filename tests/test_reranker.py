@@ -1,6 +1,6 @@
 # tests/test_reranker.py
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 from langchain_core.documents import Document
 from utils.reranker_calendar import rerank_llm, _clean
 
@@ -43,13 +43,25 @@ class TestCleanFunction:
         assert result == short_text
         assert not result.endswith("…")
 
+@pytest.fixture(scope="module", autouse=True)
+def _patched_llm():
+    """Patch the reranker's LLM once for the whole module."""
+    with patch('utils.reranker_calendar._llm') as llm:
+        yield llm
+
+@pytest.fixture
+def mock_llm(_patched_llm):
+    """The patched LLM with calls and canned replies from earlier tests cleared."""
+    _patched_llm.reset_mock(return_value=True)
+    return _patched_llm
+
 class TestRerankerLLM:
     """Test the LLM-based reranking functionality."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def sample_documents(self):
-        """Create sample documents for testing."""
-        docs = [
+        """Create sample documents for testing; a tuple so tests cannot mutate the shared copy."""
+        return (
             Document(
                 page_content="Team Meeting\nDiscuss project progress and next steps",
                 metadata={
@@ -74,148 +86,121 @@ class TestRerankerLLM:
                     "start_dt": "2025-05-29T14:00:00"
                 }
             )
-        ]
-        return docs
+        )
+    
+    @pytest.fixture(scope="module")
+    def many_documents(self):
+        """Create 25 documents, more than the reranker's 20-item cap."""
+        return tuple(
+            Document(
+                page_content=f"Doc {i}\nContent {i}",
+                metadata={"id": f"doc{i}", "type": "event", "start_dt": "2025-05-28T10:00:00"}
+            )
+            for i in range(25)
+        )
     
-    def test_rerank_formats_correctly(self, sample_documents):
+    def test_rerank_formats_correctly(self, mock_llm, sample_documents):
         """Test that documents are formatted correctly for LLM."""
         query = "What meetings do I have?"
         
         # Mock the LLM response
-        mock_response = MagicMock()
-        mock_response.content = "[0, 2]"  # Return first and third docs
-        
-        with patch('utils.reranker_calendar._llm') as mock_llm:
-            mock_llm.invoke.return_value = mock_response
-            
-            result = rerank_llm(query, sample_documents)
-            
-            # Check that LLM was called
-            mock_llm.invoke.assert_called_once()
-            call_args = mock_llm.invoke.call_args[0][0]
-            
-            # Verify the prompt contains formatted documents
-            assert "Team Meeting" in call_args
-            assert "🗓 EVENT" in call_args
-            assert "✅ TASK" in call_args
-            assert query in call_args
+        mock_llm.invoke.return_value.content = "[0, 2]"  # Return first and third docs
+        
+        result = rerank_llm(query, list(sample_documents))
+        
+        # Check that LLM was called
+        mock_llm.invoke.assert_called_once()
+        call_args = mock_llm.invoke.call_args[0][0]
+        
+        # Verify the prompt contains formatted documents
+        assert "Team Meeting" in call_args
+        assert "🗓 EVENT" in call_args
+        assert "✅ TASK" in call_args
+        assert query in call_args
     
-    def test_rerank_returns_reordered_docs(self, sample_documents):
+    def test_rerank_returns_reordered_docs(self, mock_llm, sample_documents):
         """Test that documents are returned in LLM-specified order."""
         query = "meetings"
         
         # Mock LLM to return specific order
-        mock_response = MagicMock()
-        mock_response.content = "[2, 0]"  # Return docs in reverse order
-        
-        with patch('utils.reranker_calendar._llm') as mock_llm:
-            mock_llm.invoke.return_value = mock_response
-            
-            result = rerank_llm(query, sample_documents)
-            
-            assert len(result) == 2
-            assert result[0].metadata["id"] == "event2"  # Third doc first
-            assert result[1].metadata["id"] == "event1"  # First doc second
+        mock_llm.invoke.return_value.content = "[2, 0]"  # Return docs in reverse order
+        
+        result = rerank_llm(query, list(sample_documents))
+        
+        assert len(result) == 2
+        assert result[0].metadata["id"] == "event2"  # Third doc first
+        assert result[1].metadata["id"] == "event1"  # First doc second
     
-    def test_rerank_handles_invalid_json(self, sample_documents):
+    def test_rerank_handles_invalid_json(self, mock_llm, sample_documents):
         """Test handling of invalid JSON response from LLM."""
         query = "test query"
         
         # Mock LLM to return invalid JSON
-        mock_response = MagicMock()
-        mock_response.content = "invalid json response"
-        
-        with patch('utils.reranker_calendar._llm') as mock_llm:
-            mock_llm.invoke.return_value = mock_response
-            
-            result = rerank_llm(query, sample_documents)
-            
-            # Should return original documents when JSON parsing fails
-            assert result == sample_documents
+        mock_llm.invoke.return_value.content = "invalid json response"
+        
+        result = rerank_llm(query, list(sample_documents))
+        
+        # Should return original documents when JSON parsing fails
+        assert list(result) == list(sample_documents)
     
-    def test_rerank_handles_out_of_bounds_indices(self, sample_documents):
+    def test_rerank_handles_out_of_bounds_indices(self, mock_llm, sample_documents):
         """Test handling of out-of-bounds indices from LLM."""
         query = "test query"
         
         # Mock LLM to return indices including out-of-bounds
-        mock_response = MagicMock()
-        mock_response.content = "[0, 5, 1]"  # Index 5 is out of bounds
-        
-        with patch('utils.reranker_calendar._llm') as mock_llm:
-            mock_llm.invoke.return_value = mock_response
-            
-            result = rerank_llm(query, sample_documents)
-            
-            # Should only return valid indices
-            assert len(result) == 2
-            assert result[0].metadata["id"] == "event1"  # Index 0
-            assert result[1].metadata["id"] == "task1"   # Index 1
+        mock_llm.invoke.return_value.content = "[0, 5, 1]"  # Index 5 is out of bounds
+        
+        result = rerank_llm(query, list(sample_documents))
+        
+        # Should only return valid indices
+        assert len(result) == 2
+        assert result[0].metadata["id"] == "event1"  # Index 0
+        assert result[1].metadata["id"] == "task1"   # Index 1
     
-    def test_rerank_limits_input_documents(self):
+    def test_rerank_limits_input_documents(self, mock_llm, many_documents):
         """Test that input is limited to 20 documents."""
-        # Create 25 documents
-        docs = []
-        for i in range(25):
-            docs.append(Document(
-                page_content=f"Doc {i}\nContent {i}",
-                metadata={"id": f"doc{i}", "type": "event", "start_dt": "2025-05-28T10:00:00"}
-            ))
-        
-        mock_response = MagicMock()
-        mock_response.content = "[]"
-        
-        with patch('utils.reranker_calendar._llm') as mock_llm:
-            mock_llm.invoke.return_value = mock_response
-            
-            rerank_llm("test", docs)
-            
-            # Check that prompt only contains first 20 docs
-            call_args = mock_llm.invoke.call_args[0][0]
-            assert "[19]" in call_args  # 20th document (0-indexed)
-            assert "[20]" not in call_args  # 21st document should not be included
+        mock_llm.invoke.return_value.content = "[]"
+        
+        rerank_llm("test", list(many_documents))
+        
+        # Check that prompt only contains first 20 docs
+        call_args = mock_llm.invoke.call_args[0][0]
+        assert "[19]" in call_args  # 20th document (0-indexed)
+        assert "[20]" not in call_args  # 21st document should not be included
 
-    def test_rerank_returns_empty_list(self, sample_documents):
+    def test_rerank_returns_empty_list(self, mock_llm, sample_documents):
         """Test that reranker can return empty list (all documents rejected)."""
         query = "irrelevant query"
         
         # Mock LLM to return empty list (all documents rejected)
-        mock_response = MagicMock()
-        mock_response.content = "[]"
-        
-        with patch('utils.reranker_calendar._llm') as mock_llm:
-            mock_llm.invoke.return_value = mock_response
-            
-            result = rerank_llm(query, sample_documents)
-            
-            assert result == []
-            assert len(result) == 0
+        mock_llm.invoke.return_value.content = "[]"
+        
+        result = rerank_llm(query, list(sample_documents))
+        
+        assert result == []
+        assert len(result) == 0
 
-    def test_rerank_handles_empty_input(self):
+    def test_rerank_handles_empty_input(self, mock_llm):
         """Test reranker behavior with empty document list."""
         query = "test query"
         empty_docs = []
         
         # Should return empty list immediately without calling LLM
-        with patch('utils.reranker_calendar._llm') as mock_llm:
-            result = rerank_llm(query, empty_docs)
-            
-            assert result == []
-            mock_llm.invoke.assert_not_called()
+        result = rerank_llm(query, empty_docs)
+        
+        assert result == []
+        mock_llm.invoke.assert_not_called()
 
-    def test_rerank_partial_selection(self, sample_documents):
+    def test_rerank_partial_selection(self, mock_llm, sample_documents):
         """Test reranker selecting subset of documents."""
         query = "meetings only"
         
         # Mock LLM to return only event documents (indices 0 and 2)
-        mock_response = MagicMock()
-        mock_response.content = "[0, 2]"
-        
-        with patch('utils.reranker_calendar._llm') as mock_llm:
-            mock_llm.invoke.return_value = mock_response
-            
-            result = rerank_llm(query, sample_documents)
-            
-            assert len(result) == 2
-            assert all(doc.metadata["type"] == "event" for doc in result)
-            assert result[0].metadata["id"] == "event1"
-            assert result[1].metadata["id"] == "event2"
+        mock_llm.invoke.return_value.content = "[0, 2]"
+        
+        result = rerank_llm(query, list(sample_documents))
+        
+        assert len(result) == 2
+        assert all(doc.metadata["type"] == "event" for doc in result)
+        assert result[0].metadata["id"] == "event1"
+        assert result[1].metadata["id"] == "event2"
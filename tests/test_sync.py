@@ -161,13 +161,10 @@ class TestFetchGoogle:
     @pytest.mark.asyncio
     async def test_fetch_google_events_only(self, mock_context, mock_google_event):
         """Test fetching Google Calendar events only."""
-        with patch('calendar_module.sync.get_creds', new_callable=AsyncMock) as mock_get_creds, \
+        with patch('calendar_module.sync.get_creds', new=AsyncMock(return_value=Mock())), \
              patch('calendar_module.sync.build') as mock_build:
             
             # Setup mocks
-            mock_creds = Mock()
-            mock_get_creds.return_value = mock_creds
-            
             mock_service = Mock()
             mock_events = Mock()
             mock_service.events.return_value = mock_events
@@ -201,13 +198,10 @@ class TestFetchGoogle:
     @pytest.mark.asyncio
     async def test_fetch_google_tasks_only(self, mock_context, mock_google_task):
         """Test fetching Google Tasks only."""
-        with patch('calendar_module.sync.get_creds', new_callable=AsyncMock) as mock_get_creds, \
+        with patch('calendar_module.sync.get_creds', new=AsyncMock(return_value=Mock())), \
              patch('calendar_module.sync.build') as mock_build:
             
             # Setup mocks
-            mock_creds = Mock()
-            mock_get_creds.return_value = mock_creds
-            
             mock_service = Mock()
             mock_tasks = Mock()
             mock_service.tasks.return_value = mock_tasks
@@ -240,13 +234,10 @@ class TestFetchGoogle:
     @pytest.mark.asyncio
     async def test_fetch_google_both_types(self, mock_context, mock_google_event, mock_google_task):
         """Test fetching both events and tasks."""
-        with patch('calendar_module.sync.get_creds', new_callable=AsyncMock) as mock_get_creds, \
+        with patch('calendar_module.sync.get_creds', new=AsyncMock(return_value=Mock())), \
              patch('calendar_module.sync.build') as mock_build:
             
             # Setup mocks
-            mock_creds = Mock()
-            mock_get_creds.return_value = mock_creds
-            
             # Mock calendar service
             mock_cal_service = Mock()
             mock_events = Mock()
@@ -291,13 +282,10 @@ class TestFetchGoogle:
     @pytest.mark.asyncio
     async def test_fetch_google_pagination(self, mock_context):
         """Test handling of pagination in Google API responses."""
-        with patch('calendar_module.sync.get_creds', new_callable=AsyncMock) as mock_get_creds, \
+        with patch('calendar_module.sync.get_creds', new=AsyncMock(return_value=Mock())), \
              patch('calendar_module.sync.build') as mock_build:
             
             # Setup mocks
-            mock_creds = Mock()
-            mock_get_creds.return_value = mock_creds
-            
             mock_service = Mock()
             mock_events = Mock()
             mock_service.events.return_value = mock_events
@@ -344,13 +332,10 @@ class TestFetchGoogle:
     @pytest.mark.asyncio
     async def test_fetch_google_api_error(self, mock_context):
         """Test handling of API errors during fetch."""
-        with patch('calendar_module.sync.get_creds', new_callable=AsyncMock) as mock_get_creds, \
+        with patch('calendar_module.sync.get_creds', new=AsyncMock(return_value=Mock())), \
              patch('calendar_module.sync.build') as mock_build:
             
             # Setup mocks
-            mock_creds = Mock()
-            mock_get_creds.return_value = mock_creds
-            
             mock_service = Mock()
             mock_events = Mock()
             mock_service.events.return_value = mock_events
@@ -371,8 +356,7 @@ class TestFetchGoogle:
     @pytest.mark.asyncio
     async def test_fetch_google_no_credentials(self, mock_context):
         """Test handling when credentials cannot be obtained."""
-        with patch('calendar_module.sync.get_creds', new_callable=AsyncMock) as mock_get_creds:
-            mock_get_creds.return_value = None
+        with patch('calendar_module.sync.get_creds', new=AsyncMock(return_value=None)):
             
             # Execute
             docs = await fetch_google(
@@ -395,13 +379,10 @@ class TestFetchGoogle:
             "due": "2025-05-30T00:00:00.000Z"  # Midnight UTC
         }
         
-        with patch('calendar_module.sync.get_creds', new_callable=AsyncMock) as mock_get_creds, \
+        with patch('calendar_module.sync.get_creds', new=AsyncMock(return_value=Mock())), \
              patch('calendar_module.sync.build') as mock_build:
             
             # Setup mocks
-            mock_creds = Mock()
-            mock_get_creds.return_value = mock_creds
-            
             mock_service = Mock()
             mock_tasks = Mock()
             mock_service.list.return_value.execute.return_value = {
@@ -437,13 +418,12 @@ class TestEnsureSynced:
         with patch('calendar_module.sync.get_first_last') as mock_get_first_last, \
              patch('calendar_module.sync.set_first_last') as mock_set_first_last, \
              patch('calendar_module.sync.parse_iso') as mock_parse_iso, \
-             patch('calendar_module.sync.fetch_google', new_callable=AsyncMock) as mock_fetch, \
+             patch('calendar_module.sync.fetch_google', new=AsyncMock(return_value=[Mock(metadata={"id": "test_doc"})])) as mock_fetch, \
              patch('calendar_module.sync.get_vector_store') as mock_get_store:
             
             # Setup mocks
             mock_get_first_last.return_value = (None, None)  # First sync
             mock_parse_iso.side_effect = [start_dt, end_dt]
-            mock_fetch.return_value = [Mock(metadata={"id": "test_doc"})]
             
             mock_store = Mock()
             mock_store.add_documents = Mock()
@@ -481,13 +461,12 @@ class TestEnsureSynced:
         with patch('calendar_module.sync.get_first_last') as mock_get_first_last, \
              patch('calendar_module.sync.set_first_last') as mock_set_first_last, \
              patch('calendar_module.sync.parse_iso') as mock_parse_iso, \
-             patch('calendar_module.sync.fetch_google', new_callable=AsyncMock) as mock_fetch, \
+             patch('calendar_module.sync.fetch_google', new=AsyncMock(return_value=[Mock(metadata={"id": "test_doc"})])) as mock_fetch, \
              patch('calendar_module.sync.get_vector_store') as mock_get_store:
             
             # Setup mocks
             mock_get_first_last.return_value = (existing_first, existing_last)
             mock_parse_iso.side_effect = [new_start, new_end]
-            mock_fetch.return_value = [Mock(metadata={"id": "test_doc"})]
             
             mock_store = Mock()
             mock_store.add_documents = Mock()
@@ -523,13 +502,12 @@ class TestEnsureSynced:
         with patch('calendar_module.sync.get_first_last') as mock_get_first_last, \
              patch('calendar_module.sync.set_first_last') as mock_set_first_last, \
              patch('calendar_module.sync.parse_iso') as mock_parse_iso, \
-             patch('calendar_module.sync.fetch_google', new_callable=AsyncMock) as mock_fetch, \
+             patch('calendar_module.sync.fetch_google', new=AsyncMock(return_value=[Mock(metadata={"id": "test_doc"})])) as mock_fetch, \
              patch('calendar_module.sync.get_vector_store') as mock_get_store:
             
             # Setup mocks
             mock_get_first_last.return_value = (existing_first, existing_last)
             mock_parse_iso.side_effect = [new_start, new_end]
-            mock_fetch.return_value = [Mock(metadata={"id": "test_doc"})]
             
             mock_store = Mock()
             mock_store.add_documents = Mock()
@@ -559,13 +537,12 @@ class TestEnsureSynced:
         
         with patch('calendar_module.sync.get_first_last') as mock_get_first_last, \
              patch('calendar_module.sync.parse_iso') as mock_parse_iso, \
-             patch('calendar_module.sync.fetch_google', new_callable=AsyncMock) as mock_fetch, \
+             patch('calendar_module.sync.fetch_google', new=AsyncMock(return_value=[])) as mock_fetch, \
              patch('calendar_module.sync.get_vector_store') as mock_get_store:
             
             # Setup mocks
             mock_get_first_last.return_value = (None, None)  # First sync
             mock_parse_iso.return_value = start_dt
-            mock_fetch.return_value = []
             
             mock_store = Mock()
             mock_get_store.return_value = mock_store
@@ -592,13 +569,12 @@ class TestEnsureSynced:
         with patch('calendar_module.sync.get_first_last') as mock_get_first_last, \
              patch('calendar_module.sync.set_first_last') as mock_set_first_last, \
              patch('calendar_module.sync.parse_iso') as mock_parse_iso, \
-             patch('calendar_module.sync.fetch_google', new_callable=AsyncMock) as mock_fetch, \
+             patch('calendar_module.sync.fetch_google', new=AsyncMock(return_value=[Mock(metadata={"id": "test_doc"})])) as mock_fetch, \
              patch('calendar_module.sync.get_vector_store') as mock_get_store:
             
             # Setup mocks
             mock_get_first_last.return_value = (None, None)  # First sync for both
             mock_parse_iso.side_effect = [start_dt, end_dt] * 2  # Called for each type
-            mock_fetch.return_value = [Mock(metadata={"id": "test_doc"})]
             
             mock_store = Mock()
             mock_store.add_documents = Mock()
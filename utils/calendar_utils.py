@@ -19,6 +19,9 @@ import datetime as dt
 from typing import Optional, List, Dict, Any, Tuple
 import pytz
 
+# Matches <a href="URL" ...>text</a>; compiled once for html_to_discord_md
+_HTML_LINK_RE = re.compile(r'<a\s+href="([^\"]+)"[^>]*>(.*?)</a>')
+
 # Date Parsing & Formatting Utilities
 
 def parse_iso(iso: str) -> dt.datetime:
@@ -151,5 +154,4 @@ def html_to_discord_md(html: str) -> str:
         >>> html_to_discord_md('Regular text with no links')
         'Regular text with no links'
     """
-    pattern = re.compile(r'<a\s+href="([^\"]+)"[^>]*>(.*?)</a>')
-    return pattern.sub(lambda m: f"[{m.group(2)}]({m.group(1)})", html)
\ No newline at end of file
+    return _HTML_LINK_RE.sub(lambda m: f"[{m.group(2)}]({m.group(1)})", html)
\ No newline at end of file